@@ -1,18 +1,40 @@
 #!/usr/bin/env python3
 
 import argparse
+import atexit
+import contextlib
 import csv
+import functools
+import http.client
+import io
+import itertools
+import logging
 import os
+import socket
+import sqlite3
+import ssl
 import sys
+import tempfile
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
-from urllib.error import HTTPError, URLError
-from urllib.request import Request, urlopen
-from urllib.parse import urlparse, urlunparse
+from array import array
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import IO, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, TypeVar
+from urllib.request import urlopen
+from urllib.parse import urljoin, urlparse, urlunparse
 import xml.etree.ElementTree as ET
 
+try:
+    import urllib3
+except ImportError:  # pragma: no cover - fall back to http.client keep-alive below
+    urllib3 = None  # type: ignore[assignment]
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = os.path.join(
+    os.path.expanduser("~"), ".cache", "redirect-checker", "status.sqlite"
+)
 
 DEFAULT_USER_AGENT = (
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 "
@@ -20,11 +42,211 @@ DEFAULT_USER_AGENT = (
 )
 
 
-@dataclass
-class CrawlResult:
-    url: str
-    status_code: Optional[int]
-    error: Optional[str]
+def _build_pool(maxsize: int) -> "urllib3.PoolManager":
+    return urllib3.PoolManager(
+        num_pools=64,
+        maxsize=maxsize,
+        retries=urllib3.Retry(
+            connect=2,
+            read=2,
+            status=2,
+            other=0,
+            redirect=10,
+            backoff_factor=0.1,
+            status_forcelist=(502, 503, 504),
+            raise_on_status=False,
+            raise_on_redirect=False,
+        ),
+        headers={"User-Agent": DEFAULT_USER_AGENT},
+    )
+
+
+# Shared keep-alive pool: thread-safe, so every executor worker reuses the
+# same TCP/TLS connections instead of handshaking once per URL.
+_POOL = _build_pool(32) if urllib3 is not None else None
+
+
+def configure_pool(concurrency: int) -> None:
+    """Grow the shared pool so each worker can keep its own connection per host."""
+    global _POOL
+    if _POOL is not None and concurrency > _POOL.connection_pool_kw["maxsize"]:
+        _POOL.clear()
+        _POOL = _build_pool(concurrency)
+
+
+# Without urllib3, each worker thread keeps its own http.client connection per
+# (scheme, host, port) and follows redirects itself.
+_tls = threading.local()
+_SSL_CONTEXT = ssl.create_default_context()
+_MAX_REDIRECTS = 10
+_REDIRECT_CODES = (301, 302, 303, 307, 308)
+# Replies to "Range: bytes=0-0" whose bodies are at most a byte or an error blurb
+_RANGE_CODES = (206, 416)
+
+
+def _body_is_small(method: str, status: int) -> bool:
+    # HEAD has no body; an origin that ignores Range answers 200 with the whole page
+    return method == "HEAD" or status in _RANGE_CODES
+
+
+def _pool_status(method: str, url: str, headers: Dict[str, str], timeout: float) -> int:
+    resp = _POOL.request(
+        method, url, headers=headers, timeout=timeout, redirect=True, preload_content=False
+    )
+    status = resp.status
+    if _body_is_small(method, status):
+        resp.drain_conn()
+    else:
+        # Draining would download the full page; drop the connection instead
+        resp.close()
+    resp.release_conn()
+    return status
+
+
+def _stdlib_status(method: str, url: str, headers: Dict[str, str], timeout: float) -> int:
+    conns: Dict[tuple, http.client.HTTPConnection] = _tls.__dict__.setdefault("conns", {})
+    headers = {**headers, "Connection": "keep-alive"}
+    status = 0
+    for _ in range(_MAX_REDIRECTS + 1):
+        parsed = urlparse(url)
+        scheme = parsed.scheme.lower()
+        key = (scheme, parsed.hostname, parsed.port)
+        path = (parsed.path or "/") + (f"?{parsed.query}" if parsed.query else "")
+        for attempt in range(2):
+            conn = conns.get(key)
+            if conn is None:
+                if scheme == "https":
+                    conn = http.client.HTTPSConnection(
+                        parsed.hostname, parsed.port, timeout=timeout, context=_SSL_CONTEXT
+                    )
+                else:
+                    conn = http.client.HTTPConnection(parsed.hostname, parsed.port, timeout=timeout)
+                conns[key] = conn
+            try:
+                conn.request(method, path, headers=headers)
+                resp = conn.getresponse()
+                break
+            except (http.client.HTTPException, OSError):
+                # Stale keep-alive socket: drop it and reconnect once
+                conn.close()
+                conns.pop(key, None)
+                if attempt:
+                    raise
+        status = resp.status
+        location = resp.getheader("Location")
+        is_redirect = status in _REDIRECT_CODES and bool(location)
+        if is_redirect or _body_is_small(method, status):
+            # The body must be consumed before the connection can be reused
+            resp.read()
+        else:
+            conn.close()
+            conns.pop(key, None)
+        if not is_redirect:
+            return status
+        url = urljoin(url, location)
+    return status
+
+
+def _request_status(method: str, url: str, headers: Dict[str, str], timeout: float) -> int:
+    if _POOL is not None:
+        return _pool_status(method, url, headers, timeout)
+    return _stdlib_status(method, url, headers, timeout)
+
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_size = 0
+# Borrow counts per pool; a replaced pool is shut down once its count drops to zero
+_executor_users: Dict[ThreadPoolExecutor, int] = {}
+_executor_lock = threading.Lock()
+
+
+@contextlib.contextmanager
+def get_executor(max_workers: int) -> Iterator[ThreadPoolExecutor]:
+    """Lend out the process-wide worker pool, resizing it to max_workers if needed.
+
+    A resize swaps in a new pool rather than keeping one per size, so a
+    long-lived process (the Streamlit UI) holds at most one idle pool.
+    """
+    global _executor, _executor_size
+    with _executor_lock:
+        if _executor is None or _executor_size != max_workers:
+            old = _executor
+            _executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="redir")
+            _executor_size = max_workers
+            if old is not None and old not in _executor_users:
+                old.shutdown(wait=False)
+        executor = _executor
+        _executor_users[executor] = _executor_users.get(executor, 0) + 1
+    try:
+        yield executor
+    finally:
+        with _executor_lock:
+            _executor_users[executor] -= 1
+            if _executor_users[executor] == 0:
+                del _executor_users[executor]
+                if executor is not _executor:
+                    executor.shutdown(wait=False)
+
+
+@atexit.register
+def _shutdown_executors() -> None:
+    global _executor
+    with _executor_lock:
+        pools = set(_executor_users)
+        if _executor is not None:
+            pools.add(_executor)
+        for executor in pools:
+            executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+        _executor_users.clear()
+
+
+J = TypeVar("J")
+
+
+def iter_completed(
+    executor: ThreadPoolExecutor,
+    fn: Callable[[str], Optional[int]],
+    jobs: Iterable[Tuple[J, str]],
+    window: int,
+) -> Iterator[Tuple[J, Future]]:
+    """Run fn(url) for each (key, url) job, yielding (key, future) as they finish.
+
+    At most `window` futures exist at once, so scheduling memory stays
+    O(concurrency) instead of O(URLs).
+    """
+    pending = iter(jobs)
+    inflight: Dict[Future, J] = {}
+    for key, url in itertools.islice(pending, window):
+        inflight[executor.submit(fn, url)] = key
+    while inflight:
+        done, _ = wait(inflight, return_when=FIRST_COMPLETED)
+        for future in done:
+            key = inflight.pop(future)
+            for next_key, next_url in itertools.islice(pending, 1):
+                inflight[executor.submit(fn, next_url)] = next_key
+            yield key, future
+
+
+_dns_cache: Dict[tuple, list] = {}
+_dns_lock = threading.Lock()
+_orig_getaddrinfo = socket.getaddrinfo
+
+
+def _cached_getaddrinfo(host, port, *args, **kwargs):
+    key = (host, port, args, tuple(sorted(kwargs.items())))
+    with _dns_lock:
+        cached = _dns_cache.get(key)
+    if cached is not None:
+        return cached
+    result = _orig_getaddrinfo(host, port, *args, **kwargs)
+    with _dns_lock:
+        return _dns_cache.setdefault(key, result)
+
+
+def install_dns_cache() -> None:
+    """Resolve each host once per run; sitemaps hit thousands of URLs on a few hosts."""
+    socket.getaddrinfo = _cached_getaddrinfo
 
 
 def parse_args() -> argparse.Namespace:
@@ -89,6 +311,22 @@ def parse_args() -> argparse.Namespace:
         default=DEFAULT_USER_AGENT,
         help="User-Agent header to send (default: a Safari-like UA)",
     )
+    parser.add_argument(
+        "--cache-path",
+        default=DEFAULT_CACHE_PATH,
+        help=f"SQLite file caching status codes across runs (default: {DEFAULT_CACHE_PATH})",
+    )
+    parser.add_argument(
+        "--cache-ttl",
+        type=float,
+        default=3600.0,
+        help="Seconds a cached status code stays valid (default: 3600)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always re-fetch every URL and leave the on-disk cache untouched",
+    )
     parser.add_argument(
         "-v",
         "--verbose",
@@ -107,35 +345,61 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
-def decide_page_exists_value(
-    status_code: Optional[int],
-    scope_value: str,
-    status_value: str,
-    url_matches_value: str = "",
-) -> str:
+# Sheet vocabulary, matched case-insensitively as substrings of the Scope/Status
+# columns; URL Matches must equal one of URL_MATCHES_YES
+SCOPE_IN_TOKENS = ("in scope",)
+STATUS_IN_TOKENS = ("in scope", "added to initial scope", "needed for launch")
+SCOPE_NOT_NEEDED_TOKENS = ("not in scope",)
+STATUS_NOT_NEEDED_TOKENS = ("not needed",)
+URL_MATCHES_YES = ("yes", "y", "true")
+
+
+@functools.lru_cache(maxsize=4096)
+def _classify_row(scope_value: str, status_value: str, url_matches_value: str) -> Tuple[bool, bool, bool]:
+    """Return (is_in_scope, not_needed, url_matches) for a row's text columns.
+
+    Sheets only use a handful of distinct combinations, so this is memoized.
+    """
     scope_normalized = (scope_value or "").strip().lower()
     status_normalized = (status_value or "").strip().lower()
     url_matches_normalized = (url_matches_value or "").strip().lower()
 
     is_in_scope = any(
-        token in scope_normalized for token in ("in scope",)
+        token in scope_normalized for token in SCOPE_IN_TOKENS
     ) or any(
-        token in status_normalized for token in ("in scope", "added to initial scope", "needed for launch")
+        token in status_normalized for token in STATUS_IN_TOKENS
     )
 
     not_needed = any(
-        token in scope_normalized for token in ("not in scope",)
-    ) or ("not needed" in status_normalized)
+        token in scope_normalized for token in SCOPE_NOT_NEEDED_TOKENS
+    ) or any(
+        token in status_normalized for token in STATUS_NOT_NEEDED_TOKENS
+    )
+
+    url_matches = url_matches_normalized in URL_MATCHES_YES
+    return is_in_scope, not_needed, url_matches
 
-    if status_code is None:
-        return "No" if not_needed else ("404" if is_in_scope else "No")
 
-    if 200 <= status_code < 400:
+def decide_page_exists_value(
+    status_code: Optional[int],
+    scope_value: str,
+    status_value: str,
+    url_matches_value: str = "",
+) -> str:
+    # A reachable page is "Yes" whatever the sheet says, so skip the text columns
+    if status_code is not None and 200 <= status_code < 400:
         return "Yes"
 
+    is_in_scope, not_needed, url_matches = _classify_row(
+        scope_value or "", status_value or "", url_matches_value or ""
+    )
+
+    if status_code is None:
+        return "No" if not_needed else ("404" if is_in_scope else "No")
+
     if status_code == 404:
         # If URL Matches is 'Yes', we prefer 'No' rather than '404' to avoid noise
-        if url_matches_normalized in ("yes", "y", "true"):  # treat as a structural match
+        if url_matches:  # treat as a structural match
             return "No"
         return "No" if not_needed else ("404" if is_in_scope else "No")
 
@@ -146,20 +410,91 @@ def fetch_status(
     url: str,
     timeout: float,
     user_agent: str,
-) -> CrawlResult:
+) -> Optional[int]:
+    """Return the final status code for url, or None if it could not be fetched."""
     if not url:
-        return CrawlResult(url=url, status_code=None, error="empty-url")
+        return None
 
+    headers = {"User-Agent": user_agent}
     try:
-        req = Request(url, headers={"User-Agent": user_agent})
-        with urlopen(req, timeout=timeout) as resp:
-            return CrawlResult(url=url, status_code=getattr(resp, "status", 200), error=None)
-    except HTTPError as e:
-        return CrawlResult(url=url, status_code=e.code, error=str(e))
-    except URLError as e:
-        return CrawlResult(url=url, status_code=None, error=str(e))
-    except Exception as e:  # pragma: no cover
-        return CrawlResult(url=url, status_code=None, error=str(e))
+        # HEAD first: we only need the status line, not the page body
+        status_code = _request_status("HEAD", url, headers, timeout)
+        if status_code in (405, 501):
+            # HEAD not supported: a one-byte ranged GET still avoids the body
+            status_code = _request_status("GET", url, {**headers, "Range": "bytes=0-0"}, timeout)
+            # 206 is the byte we asked for; 416 means the resource exists but is empty
+            if status_code in _RANGE_CODES:
+                status_code = 200
+        return status_code
+    except Exception as e:
+        logger.debug("Request failed for %s: %s", url, e)
+        return None
+
+
+class StatusCache:
+    """On-disk status-code cache so re-runs skip URLs checked within the TTL."""
+
+    _COMMIT_EVERY = 500
+
+    def __init__(self, path: str, ttl: float) -> None:
+        parent = os.path.dirname(path)
+        if parent:
+            os.makedirs(parent, exist_ok=True)
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS s (url TEXT PRIMARY KEY, code INTEGER NOT NULL, ts REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    def get(self, url: str) -> Optional[int]:
+        with self._lock:
+            row = self._conn.execute("SELECT code, ts FROM s WHERE url=?", (url,)).fetchone()
+        if row and time.time() - row[1] < self.ttl:
+            return row[0]
+        return None
+
+    def put(self, url: str, code: int) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO s (url, code, ts) VALUES (?, ?, ?)", (url, code, time.time())
+            )
+            self._pending += 1
+            if self._pending >= self._COMMIT_EVERY:
+                self._conn.commit()
+                self._pending = 0
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.commit()
+            self._conn.close()
+
+
+def _is_cacheable(code: int) -> bool:
+    # Only found pages are cached: a missing page is usually about to be published,
+    # and re-runs must see it as soon as it is. Errors and 5xx are transient anyway.
+    return 200 <= code < 400
+
+
+def fetch_status_cached(
+    cache: Optional[StatusCache],
+    url: str,
+    timeout: float,
+    user_agent: str,
+) -> Optional[int]:
+    if cache is None:
+        return fetch_status(url, timeout, user_agent)
+    code = cache.get(url)
+    # Caches written by older versions may still hold 404s, so re-check on read too
+    if code is not None and _is_cacheable(code):
+        return code
+    code = fetch_status(url, timeout, user_agent)
+    if code is not None and _is_cacheable(code):
+        cache.put(url, code)
+    return code
 
 
 def compute_output_path(input_path: str, override_output: Optional[str]) -> str:
@@ -180,6 +515,35 @@ def ensure_https(url: str) -> str:
     return url
 
 
+K = TypeVar("K")
+
+
+def canonicalize_url(url: str) -> str:
+    """Normalize a URL for de-duplication: lowercase scheme/host and drop default
+    ports and fragments. The path is kept as-is, since /page and /page/ can differ."""
+    try:
+        parsed = urlparse(url.strip())
+        port = parsed.port
+    except ValueError:
+        return url
+    scheme = parsed.scheme.lower()
+    host = (parsed.hostname or "").lower()
+    if port and (scheme, port) not in (("http", 80), ("https", 443)):
+        host = f"{host}:{port}"
+    return urlunparse((scheme, host, parsed.path, parsed.params, parsed.query, ""))
+
+
+def group_urls(urls_to_check: Iterable[Tuple[K, str]]) -> Dict[str, Tuple[str, List[K]]]:
+    """Map each canonical URL to (first URL seen, keys of every row using it)."""
+    groups: Dict[str, Tuple[str, List[K]]] = {}
+    for idx, url in urls_to_check:
+        key = canonicalize_url(url)
+        if key not in groups:
+            groups[key] = (url, [])
+        groups[key][1].append(idx)
+    return groups
+
+
 def build_staging_url(live_url: str, staging_base_host: str) -> str:
     staging_base_host = staging_base_host.strip().rstrip("/")
     live_url = ensure_https(live_url)
@@ -189,31 +553,61 @@ def build_staging_url(live_url: str, staging_base_host: str) -> str:
     return f"https://{staging_base_host}{path}{query}"
 
 
-def parse_sitemap_content(xml_bytes: bytes) -> List[str]:
+def _download_sitemap(url: str) -> bytes:
+    try:
+        with urlopen(ensure_https(url), timeout=15) as resp:
+            return resp.read()
+    except Exception:
+        return b""
+
+
+def parse_sitemap_content(
+    xml_bytes: bytes,
+    executor: Optional[ThreadPoolExecutor] = None,
+) -> List[str]:
     urls: List[str] = []
+    child_locs: List[str] = []
+    root = None
+    entry_tag = ""
+    depth = 0
     try:
-        root = ET.fromstring(xml_bytes)
+        # Stream the document and drop each <url>/<sitemap> once read, so peak
+        # memory stays flat even for 50k-entry sitemaps.
+        for event, elem in ET.iterparse(io.BytesIO(xml_bytes), events=("start", "end")):
+            if event == "start":
+                if root is None:
+                    root = elem
+                    tag = root.tag.lower()
+                    if tag.endswith("sitemapindex"):
+                        entry_tag = "sitemap"
+                    elif tag.endswith("urlset"):
+                        entry_tag = "url"
+                depth += 1
+                continue
+            depth -= 1
+            if depth != 1 or not entry_tag:
+                continue
+            if elem.tag.rsplit("}", 1)[-1] == entry_tag:
+                loc = (elem.findtext("{*}loc") or "").strip()
+                if loc:
+                    (urls if entry_tag == "url" else child_locs).append(loc)
+            root.clear()
     except ET.ParseError:
-        return urls
-    tag = root.tag.lower()
-    if tag.endswith("sitemapindex"):
-        for sm in root.findall("{*}sitemap"):
-            loc_el = sm.find("{*}loc")
-            if loc_el is not None and loc_el.text:
-                try:
-                    with urlopen(ensure_https(loc_el.text), timeout=15) as resp:
-                        urls.extend(parse_sitemap_content(resp.read()))
-                except Exception:
-                    continue
-    elif tag.endswith("urlset"):
-        for u in root.findall("{*}url"):
-            loc_el = u.find("{*}loc")
-            if loc_el is not None and loc_el.text:
-                urls.append(loc_el.text.strip())
+        return []
+
+    if child_locs:
+        # Download every child sitemap concurrently, then parse them in order
+        mapper = executor.map if executor is not None else map
+        for content in list(mapper(_download_sitemap, child_locs)):
+            if content:
+                urls.extend(parse_sitemap_content(content, executor))
     return urls
 
 
-def fetch_sitemap_urls(site_or_sitemap: str) -> List[str]:
+def fetch_sitemap_urls(
+    site_or_sitemap: str,
+    executor: Optional[ThreadPoolExecutor] = None,
+) -> List[str]:
     base = ensure_https(site_or_sitemap.strip())
     try_urls = [base]
     if not base.lower().endswith(".xml"):
@@ -225,7 +619,7 @@ def fetch_sitemap_urls(site_or_sitemap: str) -> List[str]:
         try:
             with urlopen(candidate, timeout=15) as resp:
                 content = resp.read()
-            urls = parse_sitemap_content(content)
+            urls = parse_sitemap_content(content, executor)
             if urls:
                 break
         except Exception:
@@ -233,6 +627,14 @@ def fetch_sitemap_urls(site_or_sitemap: str) -> List[str]:
     return sorted(set(urls))
 
 
+# Per-row status codes live in a compact array('i'); NO_STATUS marks "no response"
+NO_STATUS = -1
+
+
+def new_status_array(size: int) -> array:
+    return array("i", [NO_STATUS]) * size
+
+
 def is_ok(status_code: Optional[int]) -> bool:
     return status_code is not None and 200 <= status_code < 400
 
@@ -241,8 +643,7 @@ def generate_rows_from_sitemap(
     site_or_sitemap: str,
     staging_base_host: str,
     precheck: bool = True,
-) -> Tuple[List[Dict[str, str]], List[str]]:
-    live_urls = fetch_sitemap_urls(site_or_sitemap)
+) -> Tuple[List[List[str]], List[str]]:
     fieldnames = [
         "Live Site URL",
         "Theoretical Staging Link",
@@ -252,71 +653,165 @@ def generate_rows_from_sitemap(
         "Scope",
         "Status",
     ]
-    rows: List[Dict[str, str]] = []
-    if not live_urls:
-        return rows, fieldnames
-
-    # Precompute staging URLs
-    staging_urls = [build_staging_url(live, staging_base_host) for live in live_urls]
-
-    live_status: List[Optional[int]] = [None] * len(live_urls)
-    staging_status: List[Optional[int]] = [None] * len(staging_urls)
-
-    if precheck:
-        with ThreadPoolExecutor(max_workers=32) as executor:
-            futures = {}
-            for i, u in enumerate(live_urls):
-                futures[executor.submit(fetch_status, ensure_https(u), 10.0, DEFAULT_USER_AGENT)] = ("live", i)
-            for i, u in enumerate(staging_urls):
-                futures[executor.submit(fetch_status, ensure_https(u), 10.0, DEFAULT_USER_AGENT)] = ("staging", i)
-            for fut in as_completed(futures):
-                kind, idx = futures[fut]
+    rows: List[List[str]] = []
+
+    # One pool serves both the child-sitemap downloads and the precheck
+    with get_executor(32) as executor:
+        live_urls = fetch_sitemap_urls(site_or_sitemap, executor)
+        if not live_urls:
+            return rows, fieldnames
+
+        # Precompute staging URLs
+        staging_urls = [build_staging_url(live, staging_base_host) for live in live_urls]
+
+        live_status = new_status_array(len(live_urls))
+        staging_status = new_status_array(len(staging_urls))
+
+        if precheck:
+            # One fetch per unique URL across both hosts, fanned back out by (kind, index)
+            url_groups = group_urls(
+                [(("live", i), ensure_https(u)) for i, u in enumerate(live_urls)]
+                + [(("staging", i), ensure_https(u)) for i, u in enumerate(staging_urls)]
+            )
+            fetch = functools.partial(fetch_status, timeout=10.0, user_agent=DEFAULT_USER_AGENT)
+            jobs = ((targets, url) for url, targets in url_groups.values())
+            for targets, fut in iter_completed(executor, fetch, jobs, window=64):
                 try:
-                    res = fut.result()
-                    code = res.status_code
+                    code = fut.result()
                 except Exception:
                     code = None
-                if kind == "live":
-                    live_status[idx] = code
-                else:
-                    staging_status[idx] = code
+                if code is None:
+                    code = NO_STATUS
+                for kind, idx in targets:
+                    if kind == "live":
+                        live_status[idx] = code
+                    else:
+                        staging_status[idx] = code
 
     for i, live in enumerate(live_urls):
         staging = staging_urls[i]
         page_exists = "Yes" if is_ok(staging_status[i]) else "No"
         url_matches = "Yes" if (is_ok(live_status[i]) and is_ok(staging_status[i])) else "Page Does Not Exist"
-        rows.append(
-            {
-                "Live Site URL": live,
-                "Theoretical Staging Link": staging,
-                "Page Exists?": page_exists,
-                "URL Matches": url_matches,
-                "Redirect URL": "",
-                "Scope": "",
-                "Status": "",
-            }
-        )
+        # Aligned with fieldnames above
+        rows.append([live, staging, page_exists, url_matches, "", "", ""])
     return rows, fieldnames
 
 
-def read_csv_rows(input_path: str) -> Tuple[List[Dict[str, str]], List[str]]:
-    with open(input_path, "r", newline="", encoding="utf-8-sig") as f:
-        reader = csv.DictReader(f)
-        rows: List[Dict[str, str]] = [dict(row) for row in reader]
-        fieldnames = reader.fieldnames or []
-    return rows, fieldnames
+def _csv_needs_quotes(value: str) -> bool:
+    # Same rule as csv.QUOTE_MINIMAL with the default dialect
+    return "," in value or '"' in value or "\n" in value or "\r" in value
 
 
-def write_csv_rows(output_path: str, fieldnames: List[str], rows: List[Dict[str, str]]) -> None:
-    with open(output_path, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        for row in rows:
-            writer.writerow(row)
+def _quote_csv_field(value: str) -> str:
+    if _csv_needs_quotes(value):
+        return '"' + value.replace('"', '""') + '"'
+    return value
+
+
+def update_quote_flags(need_quote: List[bool], row: Sequence[str]) -> None:
+    """Flag the columns of row holding a value that must be quoted in CSV output.
+
+    need_quote grows to cover fields past the header, which are written through as-is.
+    """
+    if len(row) > len(need_quote):
+        need_quote.extend([False] * (len(row) - len(need_quote)))
+    joined = "\x00".join(row)
+    if "," in joined or '"' in joined or "\n" in joined or "\r" in joined:
+        for i, value in enumerate(row):
+            if not need_quote[i] and _csv_needs_quotes(value):
+                need_quote[i] = True
+
+
+def make_csv_line_formatter(need_quote: List[bool]) -> Callable[[Sequence[str]], str]:
+    """Build a row -> CSV line function that skips escaping for columns known to be safe.
+
+    Output is byte-identical to csv.writer with the default dialect.
+    """
+    quoted = [i for i, flag in enumerate(need_quote) if flag]
+    if not quoted:
+        return lambda row: ",".join(row) + "\r\n"
+
+    def format_line(row: Sequence[str]) -> str:
+        fields = list(row)
+        for i in quoted:
+            if i >= len(fields):
+                break
+            fields[i] = _quote_csv_field(fields[i])
+        return ",".join(fields) + "\r\n"
+
+    return format_line
+
+
+def rows_to_columns(fieldnames: List[str], rows: List[List[str]]) -> Dict[str, List[str]]:
+    """Transpose list rows aligned to fieldnames into {column name: values}."""
+    if not rows:
+        return {name: [] for name in fieldnames}
+    return dict(zip(fieldnames, map(list, zip(*rows))))
+
+
+def read_csv_columns(f: IO[str]) -> Tuple[Dict[str, List[str]], List[str]]:
+    """Read an open CSV into {column name: values}, appending each field to its
+    column as it is read.
+
+    Short rows are padded with ""; a row wider than the header raises csv.Error,
+    since its extra fields have no column to go in.
+    """
+    reader = csv.reader(f)
+    fieldnames = next(reader, [])
+    width = len(fieldnames)
+    values: List[List[str]] = [[] for _ in fieldnames]
+    appends = [column.append for column in values]
+    for row in reader:
+        if not row:
+            continue
+        if len(row) > width:
+            raise csv.Error(f"line {reader.line_num} has {len(row)} fields but the header has {width}")
+        for append, value in zip(appends, row):
+            append(value)
+        for append in appends[len(row):]:
+            append("")
+    return dict(zip(fieldnames, values)), fieldnames
+
+
+def scan_staging_links(
+    input_path: str,
+) -> Tuple[List[str], List[Tuple[int, str]], int, List[bool]]:
+    """First streaming pass: return the header, (row index, URL) pairs to check,
+    the number of data rows and which columns need CSV quoting, without keeping
+    the rows themselves."""
+    urls_to_check: List[Tuple[int, str]] = []
+    row_count = 0
+    with open(input_path, "r", newline="", encoding="utf-8-sig") as f:
+        reader = csv.reader(f)
+        fieldnames = next(reader, [])
+        need_quote = [False] * len(fieldnames)
+        if "Theoretical Staging Link" not in fieldnames:
+            return fieldnames, urls_to_check, row_count, need_quote
+        url_i = {name: i for i, name in enumerate(fieldnames)}["Theoretical Staging Link"]
+        for row in reader:
+            if not row:
+                continue
+            url = row[url_i].strip() if url_i < len(row) else ""
+            if url:
+                urls_to_check.append((row_count, url))
+            update_quote_flags(need_quote, row)
+            row_count += 1
+    return fieldnames, urls_to_check, row_count, need_quote
+
+
+def write_csv_rows(output_path: str, fieldnames: List[str], rows: List[List[str]]) -> None:
+    need_quote = [False] * len(fieldnames)
+    for row in rows:
+        update_quote_flags(need_quote, row)
+    format_line = make_csv_line_formatter(need_quote)
+    with open(output_path, "w", newline="", encoding="utf-8", buffering=1 << 20) as f:
+        f.write(",".join(map(_quote_csv_field, fieldnames)) + "\r\n")
+        f.writelines(map(format_line, rows))
 
 
 def main() -> int:
     args = parse_args()
+    install_dns_cache()
 
     # Generation mode
     if args.command == "generate":
@@ -347,11 +842,17 @@ def main() -> int:
     concurrency = max(1, int(args.concurrency))
     user_agent = args.user_agent
     verbose = bool(getattr(args, "verbose", False))
+    if verbose:
+        # Surface per-URL failure reasons on our logger only, not urllib3's
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        logger.addHandler(handler)
+        logger.setLevel(logging.DEBUG)
 
     if verbose:
         print(f"Reading CSV: {input_path}")
     try:
-        rows, fieldnames = read_csv_rows(input_path)
+        fieldnames, urls_to_check, row_count, need_quote = scan_staging_links(input_path)
     except FileNotFoundError:
         print(f"Input file not found: {input_path}", file=sys.stderr)
         return 2
@@ -362,99 +863,152 @@ def main() -> int:
         print("Missing required column(s) in CSV: " + ", ".join(missing), file=sys.stderr)
         return 2
 
-    urls_to_check: List[Tuple[int, str]] = []
-    for idx, row in enumerate(rows):
-        url = (row.get("Theoretical Staging Link") or "").strip()
-        if url:
-            urls_to_check.append((idx, url))
-
-    index_to_result: Dict[int, CrawlResult] = {}
+    status_arr = new_status_array(row_count)
     if urls_to_check:
+        url_groups = group_urls(urls_to_check)
         if verbose:
             print(
-                f"Checking {len(urls_to_check)} URLs with concurrency={concurrency}, timeout={timeout}s"
+                f"Checking {len(url_groups)} unique URLs ({len(urls_to_check)} rows) "
+                f"with concurrency={concurrency}, timeout={timeout}s"
             )
-        with ThreadPoolExecutor(max_workers=concurrency) as executor:
-            future_to_info = {
-                executor.submit(fetch_status, url, timeout, user_agent): (idx, url)
-                for idx, url in urls_to_check
-            }
+        configure_pool(concurrency)
+        cache: Optional[StatusCache] = None
+        if not args.no_cache and args.cache_ttl > 0:
+            try:
+                cache = StatusCache(args.cache_path, args.cache_ttl)
+            except (OSError, sqlite3.Error) as e:
+                print(f"Status cache disabled ({args.cache_path}): {e}", file=sys.stderr)
+        try:
+            fetch = functools.partial(fetch_status_cached, cache, timeout=timeout, user_agent=user_agent)
+            jobs = (((url, indices), url) for url, indices in url_groups.values())
             completed = 0
-            total = len(future_to_info)
-            for future in as_completed(future_to_info):
-                idx, url = future_to_info[future]
-                try:
-                    result = future.result()
-                except Exception as e:  # pragma: no cover
-                    result = CrawlResult(url="", status_code=None, error=str(e))
-                index_to_result[idx] = result
-                completed += 1
-                if verbose:
-                    status_repr = (
-                        str(result.status_code)
-                        if result.status_code is not None
-                        else f"error: {result.error}"
-                    )
-                    print(f"[{completed}/{total}] {url} -> {status_repr}")
+            total = len(url_groups)
+            # Verbose lines are flushed in batches; one print per URL dominates on fast hosts
+            progress_lines: List[str] = []
+            last_flush = time.monotonic()
+            with get_executor(concurrency) as executor:
+                for (url, indices), future in iter_completed(executor, fetch, jobs, 2 * concurrency):
+                    try:
+                        code = future.result()
+                    except Exception as e:  # pragma: no cover
+                        logger.debug("Request failed for %s: %s", url, e)
+                        code = None
+                    for idx in indices:
+                        status_arr[idx] = code if code is not None else NO_STATUS
+                    completed += 1
+                    if verbose:
+                        status_repr = str(code) if code is not None else "error"
+                        progress_lines.append(f"[{completed}/{total}] {url} -> {status_repr}")
+                        now = time.monotonic()
+                        if len(progress_lines) >= 100 or now - last_flush >= 0.5 or completed == total:
+                            print("\n".join(progress_lines), flush=True)
+                            progress_lines.clear()
+                            last_flush = now
+        finally:
+            if cache is not None:
+                cache.close()
+
+    # Second streaming pass: classify each input row and write it straight out
+    columns = {name: i for i, name in enumerate(fieldnames)}
+    width = len(fieldnames)
+    url_i = columns["Theoretical Staging Link"]
+    page_exists_i = columns["Page Exists?"]
+    scope_i = columns.get("Scope")
+    status_i = columns.get("Status")
+    url_matches_i = columns.get("URL Matches")
+
+    pasteable_path: Optional[str] = None
+    if bool(getattr(args, "pasteable", False)):
+        pasteable_path = args.pasteable_file
+        if not pasteable_path:
+            parent, base = os.path.split(output_path)
+            name, _ext = os.path.splitext(base)
+            pasteable_path = os.path.join(parent, f"{name}-page-exists.txt")
+
+    # Classifier output is always safe, so only the input's own values can need quoting
+    need_quote[page_exists_i] = False
+    format_line = make_csv_line_formatter(need_quote)
+
+    # Outputs go to temp files that replace their targets only once complete, so
+    # `-o` may name the input file (updating it in place) without truncating it
+    # before the second pass has read it.
+    replacements: List[Tuple[str, str]] = []
+    umask = os.umask(0)
+    os.umask(umask)
+
+    def open_output(path: str, **kwargs):
+        fd, tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(os.path.abspath(path)), prefix=".redirect-", suffix=".tmp"
+        )
+        replacements.append((tmp_path, path))
+        # mkstemp creates 0600 files; give outputs the usual permissions
+        os.chmod(tmp_path, 0o666 & ~umask)
+        return stack.enter_context(open(fd, "w", encoding="utf-8", **kwargs))
 
     yes_count = 0
     no_count = 0
     not_found_count = 0
-    pasteable_values: List[str] = []
-    for idx, row in enumerate(rows):
-        scope_value = row.get("Scope", "")
-        status_value = row.get("Status", "")
-        url_matches_value = row.get("URL Matches", "")
-        crawl_result = index_to_result.get(idx)
-        status_code = crawl_result.status_code if crawl_result else None
-
-        page_exists_value = decide_page_exists_value(
-            status_code, scope_value, status_value, url_matches_value
-        )
-        row["Page Exists?"] = page_exists_value
-        pasteable_values.append(page_exists_value)
-        if verbose:
-            theoretical_url = (row.get("Theoretical Staging Link") or "").strip()
-            print(
-                f"Classified: {theoretical_url or '<empty>'} -> Page Exists?={page_exists_value}"
-            )
-        if page_exists_value == "Yes":
-            yes_count += 1
-        elif page_exists_value == "404":
-            not_found_count += 1
-        else:
-            no_count += 1
-
     try:
-        write_csv_rows(output_path, fieldnames, rows)
-    except Exception as e:  # pragma: no cover
+        with contextlib.ExitStack() as stack:
+            in_f = stack.enter_context(open(input_path, "r", newline="", encoding="utf-8-sig"))
+            out_f = open_output(output_path, newline="", buffering=1 << 20)
+            paste_f = open_output(pasteable_path) if pasteable_path else None
+            reader = csv.reader(in_f)
+            header = next(reader, None)
+            if header is None:
+                raise csv.Error(f"input file is empty: {input_path}")
+            out_f.write(",".join(map(_quote_csv_field, header)) + "\r\n")
+            idx = -1
+            for row in reader:
+                if not row:
+                    continue
+                idx += 1
+                # Pad short rows; fields past the header are kept and written through
+                if len(row) < width:
+                    row += [""] * (width - len(row))
+                scope_value = row[scope_i] if scope_i is not None else ""
+                status_value = row[status_i] if status_i is not None else ""
+                url_matches_value = row[url_matches_i] if url_matches_i is not None else ""
+                status_code = status_arr[idx]
+                if status_code == NO_STATUS:
+                    status_code = None
+
+                page_exists_value = decide_page_exists_value(
+                    status_code, scope_value, status_value, url_matches_value
+                )
+                row[page_exists_i] = page_exists_value
+                out_f.write(format_line(row))
+                if paste_f is not None:
+                    paste_f.write(f"{page_exists_value}\n")
+                if verbose:
+                    theoretical_url = row[url_i].strip()
+                    print(
+                        f"Classified: {theoretical_url or '<empty>'} -> Page Exists?={page_exists_value}"
+                    )
+                if page_exists_value == "Yes":
+                    yes_count += 1
+                elif page_exists_value == "404":
+                    not_found_count += 1
+                else:
+                    no_count += 1
+        for tmp_path, path in replacements:
+            os.replace(tmp_path, path)
+    except (OSError, csv.Error) as e:  # pragma: no cover
+        for tmp_path, _path in replacements:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
         print(f"Failed to write output CSV: {e}", file=sys.stderr)
         return 3
 
     if verbose:
         print(
-            f"Summary: Yes={yes_count}, 404={not_found_count}, No={no_count} across {len(rows)} rows"
+            f"Summary: Yes={yes_count}, 404={not_found_count}, No={no_count} across {row_count} rows"
         )
     print(f"Wrote: {output_path}")
-
-    if bool(getattr(args, "pasteable", False)):
-        pasteable_path = args.pasteable_file
-        if not pasteable_path:
-            parent, base = os.path.split(output_path)
-            name, _ext = os.path.splitext(base)
-            pasteable_path = os.path.join(parent, f"{name}-page-exists.txt")
-        try:
-            with open(pasteable_path, "w", encoding="utf-8") as f:
-                for value in pasteable_values:
-                    f.write(f"{value}\n")
-            print(f"Pasteable column written to: {pasteable_path}")
-        except Exception as e:  # pragma: no cover
-            print(f"Failed to write pasteable file: {e}", file=sys.stderr)
-            return 3
+    if pasteable_path:
+        print(f"Pasteable column written to: {pasteable_path}")
     return 0
 
 
 if __name__ == "__main__":
     raise SystemExit(main())
-
-
@@ -1,10 +1,12 @@
 import csv
+import functools
 import io
 import os
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, List, Tuple
 
+import numpy as np
+import pandas as pd
 import streamlit as st
 try:
     # When run as part of a package (python -m ...)
@@ -16,63 +18,101 @@ except Exception:
     import redirect as redirect_mod  # type: ignore
 
 
-def read_csv_from_bytes(data: bytes) -> Tuple[List[Dict[str, str]], List[str]]:
+def read_csv_from_bytes(data: bytes) -> Tuple[Dict[str, List[str]], List[str]]:
     text = data.decode("utf-8-sig", errors="replace")
-    reader = csv.DictReader(io.StringIO(text))
-    rows: List[Dict[str, str]] = [dict(row) for row in reader]
-    fieldnames = reader.fieldnames or []
-    return rows, fieldnames
+    return redirect_mod.read_csv_columns(io.StringIO(text, newline=""))
 
 
-def write_csv_to_bytes(fieldnames: List[str], rows: List[Dict[str, str]]) -> bytes:
+def write_csv_to_bytes(fieldnames: List[str], columns: Dict[str, List[str]]) -> bytes:
     buf = io.StringIO()
-    writer = csv.DictWriter(buf, fieldnames=fieldnames)
-    writer.writeheader()
-    for row in rows:
-        writer.writerow(row)
+    writer = csv.writer(buf)
+    writer.writerow(fieldnames)
+    writer.writerows(zip(*[columns[name] for name in fieldnames]))
     return buf.getvalue().encode("utf-8")
 
 
-def run_checks(rows: List[Dict[str, str]], concurrency: int, timeout: float, user_agent: str) -> Tuple[List[Dict[str, str]], List[str]]:
+def _normalized(values: List[str]) -> "pd.Series":
+    return pd.Series(values, dtype=object).fillna("").astype(str).str.strip().str.lower()
+
+
+def _contains_any(values: "pd.Series", tokens: Tuple[str, ...]) -> "np.ndarray":
+    hits = np.zeros(len(values), dtype=bool)
+    for token in tokens:
+        hits |= values.str.contains(token, regex=False).to_numpy()
+    return hits
+
+
+def classify_page_exists(
+    status_codes: "np.ndarray",
+    scope_values: List[str],
+    status_values: List[str],
+    url_matches_values: List[str],
+) -> List[str]:
+    """Vectorised equivalent of redirect.decide_page_exists_value over whole columns.
+
+    status_codes uses redirect.NO_STATUS for URLs that could not be fetched.
+    """
+    scope = _normalized(scope_values)
+    status = _normalized(status_values)
+    url_matches = _normalized(url_matches_values).isin(redirect_mod.URL_MATCHES_YES).to_numpy()
+
+    is_in_scope = _contains_any(scope, redirect_mod.SCOPE_IN_TOKENS) | _contains_any(
+        status, redirect_mod.STATUS_IN_TOKENS
+    )
+    not_needed = _contains_any(scope, redirect_mod.SCOPE_NOT_NEEDED_TOKENS) | _contains_any(
+        status, redirect_mod.STATUS_NOT_NEEDED_TOKENS
+    )
+
+    is_ok = (status_codes >= 200) & (status_codes < 400)
+    # Unreachable pages and 404s report "404" for in-scope rows, unless URL Matches
+    # marks a 404 as a structural match
+    missing = (status_codes == redirect_mod.NO_STATUS) | ((status_codes == 404) & ~url_matches)
+    flag_404 = missing & is_in_scope & ~not_needed
+    return np.select([is_ok, flag_404], ["Yes", "404"], default="No").tolist()
+
+
+def run_checks(columns: Dict[str, List[str]], concurrency: int, timeout: float, user_agent: str) -> Tuple[Dict[str, List[str]], List[str]]:
+    links = columns["Theoretical Staging Link"]
+    row_count = len(links)
     urls_to_check: List[Tuple[int, str]] = []
-    for idx, row in enumerate(rows):
-        url = (row.get("Theoretical Staging Link") or "").strip()
+    for idx, url in enumerate(links):
+        url = (url or "").strip()
         if url:
             urls_to_check.append((idx, url))
 
-    index_to_result: Dict[int, redirect_mod.CrawlResult] = {}
+    status_arr = redirect_mod.new_status_array(row_count)
+    url_groups = redirect_mod.group_urls(urls_to_check)
     progress = st.progress(0.0, text="Starting...")
-    total = len(urls_to_check) or 1
+    total = len(url_groups) or 1
+    progress_step = max(1, total // 100)
     completed = 0
 
-    if urls_to_check:
-        with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
-            future_to_info = {
-                executor.submit(redirect_mod.fetch_status, url, timeout, user_agent): (idx, url)
-                for idx, url in urls_to_check
-            }
-            for future in as_completed(future_to_info):
-                idx, url = future_to_info[future]
+    if url_groups:
+        redirect_mod.configure_pool(concurrency)
+        fetch = functools.partial(redirect_mod.fetch_status, timeout=timeout, user_agent=user_agent)
+        jobs = ((indices, url) for url, indices in url_groups.values())
+        with redirect_mod.get_executor(max(1, concurrency)) as executor:
+            for indices, future in redirect_mod.iter_completed(executor, fetch, jobs, 2 * max(1, concurrency)):
                 try:
-                    result = future.result()
-                except Exception as e:
-                    result = redirect_mod.CrawlResult(url=url, status_code=None, error=str(e))
-                index_to_result[idx] = result
+                    code = future.result()
+                except Exception:
+                    code = None
+                for idx in indices:
+                    status_arr[idx] = code if code is not None else redirect_mod.NO_STATUS
                 completed += 1
-                progress.progress(min(1.0, completed / total), text=f"Checked {completed}/{total}")
+                # Re-render at most ~100 times; every st.progress call is a round-trip to the browser
+                if completed % progress_step == 0 or completed == total:
+                    progress.progress(min(1.0, completed / total), text=f"Checked {completed}/{total}")
 
-    pasteable_values: List[str] = []
-    for idx, row in enumerate(rows):
-        scope_value = row.get("Scope", "")
-        status_value = row.get("Status", "")
-        url_matches_value = row.get("URL Matches", "")
-        crawl_result = index_to_result.get(idx)
-        status_code = crawl_result.status_code if crawl_result else None
-        value = redirect_mod.decide_page_exists_value(status_code, scope_value, status_value, url_matches_value)
-        row["Page Exists?"] = value
-        pasteable_values.append(value)
+    pasteable_values = classify_page_exists(
+        np.frombuffer(status_arr, dtype=np.intc),
+        columns.get("Scope") or [""] * row_count,
+        columns.get("Status") or [""] * row_count,
+        columns.get("URL Matches") or [""] * row_count,
+    )
+    columns["Page Exists?"] = pasteable_values
 
-    return rows, pasteable_values
+    return columns, pasteable_values
 
 
 def main() -> None:
@@ -83,7 +123,7 @@ def main() -> None:
 
     with st.sidebar:
         st.header("Check Settings")
-        concurrency = st.slider("Concurrency", min_value=1, max_value=64, value=20)
+        concurrency = st.slider("Concurrency", min_value=1, max_value=128, value=20)
         timeout = st.number_input("Timeout (seconds)", min_value=1.0, max_value=60.0, value=10.0, step=1.0)
         user_agent = st.text_input("User-Agent", value=redirect_mod.DEFAULT_USER_AGENT)
 
@@ -106,7 +146,8 @@ def main() -> None:
                     st.warning("No URLs found in sitemap.")
                 else:
                     st.success(f"Found {len(rows)} URLs")
-                    edited = st.data_editor(rows, use_container_width=True, num_rows="dynamic")
+                    columns = redirect_mod.rows_to_columns(fieldnames, rows)
+                    edited = st.data_editor(columns, use_container_width=True, num_rows="dynamic")
                     csv_bytes = write_csv_to_bytes(fieldnames, edited)
                     ts = time.strftime("%Y%m%d-%H%M%S")
                     base = "sitemap"
@@ -120,8 +161,13 @@ def main() -> None:
         if not uploaded:
             st.info("CSV must include columns: 'Theoretical Staging Link', 'Page Exists?', 'URL Matches', 'Scope', 'Status'.")
             return
-        rows, fieldnames = read_csv_from_bytes(uploaded.read())
-        if not rows:
+        try:
+            columns, fieldnames = read_csv_from_bytes(uploaded.read())
+        except csv.Error as e:
+            st.error(f"Could not read the uploaded CSV: {e}")
+            return
+        row_count = len(columns[fieldnames[0]]) if fieldnames else 0
+        if not row_count:
             st.warning("No rows detected in the uploaded CSV.")
             return
         missing = [
@@ -131,13 +177,13 @@ def main() -> None:
         if missing:
             st.error("Missing required column(s): " + ", ".join(missing))
             return
-        st.write(f"Rows detected: {len(rows)}")
+        st.write(f"Rows detected: {row_count}")
         if st.button("Run Checks", type="primary"):
             start = time.time()
-            updated_rows, pasteable_values = run_checks(rows, concurrency, float(timeout), user_agent)
+            updated_columns, pasteable_values = run_checks(columns, concurrency, float(timeout), user_agent)
             elapsed = time.time() - start
             st.success(f"Done in {elapsed:.1f}s")
-            csv_bytes = write_csv_to_bytes(fieldnames, updated_rows)
+            csv_bytes = write_csv_to_bytes(fieldnames, updated_columns)
             ts = time.strftime("%Y%m%d-%H%M%S")
             base = os.path.splitext(uploaded.name)[0]
             out_name = f"{base}-checked-{ts}.csv"